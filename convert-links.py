@@ -3,7 +3,7 @@ from pathlib import Path
 
 from source.conf import redirects
 
-LINK_PATTERN = r"([^>`]?)`([^<`\n]*)<([^>@\n ]+)>`_[_]?"
+LINK_PATTERN = re.compile(r"([^>`]?)`([^<`\n]*)<([^>@\n ]+)>`_[_]?")
 IGNORE_DIRECTORIES = [
     "_static",
     "archive",
@@ -13,6 +13,7 @@ IGNORE_DIRECTORIES = [
     "samples",
     "scripts",
 ]
+IGNORE_PREFIXES = tuple(f"source/{ignore_dir}" for ignore_dir in IGNORE_DIRECTORIES)
 
 
 def resolve_redirect(filename: str) -> str:
@@ -68,17 +69,14 @@ def process_match(match: re.Match) -> str:
 
 
 def should_ignore_file(filename: str) -> bool:
-    for ignore_dir in IGNORE_DIRECTORIES:
-        if filename.startswith(f"source/{ignore_dir}"):
-            return True
-    return False
+    return filename.startswith(IGNORE_PREFIXES)
 
 
 if __name__ == "__main__":
     # grep command: grep -aEon '[^>`]?`[^<`]*<[^>@ ]+>`_[_]?' xxxxx.rst
     # rst_file = Path("source/onboard/shared-channels.rst")
     # raw_content = rst_file.read_text("utf-8")
-    # re.sub(LINK_PATTERN, process_match, raw_content)
+    # LINK_PATTERN.sub(process_match, raw_content)
     source_path = Path("source")
     rst_files = sorted(source_path.glob("**/*.rst"))
     print(f"Process {len(rst_files)} rST files")
@@ -95,7 +93,7 @@ if __name__ == "__main__":
         print(f"o  {rst_file}")
         raw_content = rst_file.read_text("utf-8")
         # Process rST links in the file
-        subbed_content = re.sub(LINK_PATTERN, process_match, raw_content)
+        subbed_content = LINK_PATTERN.sub(process_match, raw_content)
         # Write the processed file back to disk
         rst_file.write_text(subbed_content, "utf-8")
     print("done.")
@@ -22,6 +22,7 @@ from docutils.parsers.rst.directives import unchanged
 from docutils.parsers.rst.states import Inliner
 from sphinx.application import Sphinx
 from sphinx.util.docutils import SphinxDirective
+from types import MappingProxyType
 from typing import Dict, Any, List, Tuple
 
 
@@ -75,18 +76,13 @@ def visit(visitor: NodeVisitor, node: CompassIconContainer):
       :param visitor: The docutils NodeVisitor
       :param node: The CompassIconContainer node to visit
     """
-    # Copy the existing attributes from the container node
-    node_attributes = node.attributes.copy()
-    # Remove the default node attributes since we don't need them
-    node_attributes.pop("classes")
-    node_attributes.pop("backrefs")
-    node_attributes.pop("names")
-    node_attributes.pop("dupnames")
-    # Set the appropriate HTML tag attributes
-    node_attributes["class"] = node.icon_name
-    node_attributes["role"] = "image"
-    node_attributes["aria-label"] = node.icon_description
-    node_attributes["title"] = node.icon_description
+    # Set the appropriate HTML tag attributes; starttag() adds the node's own ids and classes
+    node_attributes = {
+        "class": node.icon_name,
+        "role": "image",
+        "aria-label": node.icon_description,
+        "title": node.icon_description,
+    }
     # Generate the starting HTML tag
     text = visitor.starttag(node, node.tagname, **node_attributes)
     # Add the tag to the rendered document
@@ -123,18 +119,11 @@ def compass_icon_role(
       :param content: (unused)
       :return: A tuple containing the list of nodes to add to the document
     """
-    icon_name = ""
-    icon_description = ""
     """
-    Split the text parameter on a comma (,). The first token is the icon name. If there is a second token,
-    then it will be used as the icon description.
+    Partition the text parameter on the first comma (,). The text before it is the icon name. If there is text
+    after it, then it will be used as the icon description.
     """
-    tokens = text.split(",", 1)
-    if len(tokens) == 2:
-        icon_name = tokens[0]
-        icon_description = tokens[1]
-    elif len(tokens) == 1:
-        icon_name = tokens[0]
+    icon_name, _, icon_description = text.partition(",")
     # Return a new CompassIconContainer object that includes the icon name and optional description
     return [CompassIconContainer(icon_name, icon_description)], list()
 
@@ -150,8 +139,8 @@ class CompassIconDirective(SphinxDirective):
     required_arguments = 1
     # The one argument can contain whitespace, if needed
     final_argument_whitespace = True
-    # Define the `description` directive option
-    option_spec = {OPTION_DESCRIPTION: unchanged}
+    # Define the `description` directive option; read-only since it is shared by every directive instance
+    option_spec = MappingProxyType({OPTION_DESCRIPTION: unchanged})
 
     def run(self) -> List[nodes.Node]:
         """
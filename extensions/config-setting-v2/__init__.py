@@ -14,6 +14,7 @@ from sphinx.util import logging
 from sphinx.util.console import bold  # type: ignore
 from sphinx.util.docutils import SphinxTranslator, SphinxDirective
 from sphinx.util.nodes import make_refnode
+from types import MappingProxyType
 from typing import Optional, Iterable, Tuple, List, Dict, Any
 
 __version__ = "0.2.0"
@@ -26,6 +27,8 @@ CONFIG_SETTING_SYSTEMCONSOLE = "systemconsole"
 CONFIG_SETTING_CONFIGJSON = "configjson"
 CONFIG_SETTING_ENVIRONMENT = "environment"
 CONFIG_SETTING_DESCRIPTION = "description"
+# Per-document temp_data key; set when the document being read contains at least one config setting
+TEMP_DATA_HAS_CONFIG_SETTINGS = "config-setting-v2:has-config-settings"
 
 # Sphinx logger
 logger = logging.getLogger(__name__)
@@ -83,9 +86,7 @@ class ConfigSettingNode(Element):
 
     def __init__(self, settings: Optional[Dict[str, str]]):
         super().__init__()
-        self.config_settings = dict()
-        if settings is not None:
-            self.config_settings = settings
+        self.config_settings = settings if settings is not None else dict()
 
 
 def visit_config_setting_node(
@@ -103,24 +104,25 @@ def depart_config_setting_node(
 class ConfigSettingDirective(SphinxDirective):
     has_content = True
     required_arguments = 1
-    option_spec = {
-        CONFIG_SETTING_DISPLAYNAME: unchanged,
-        CONFIG_SETTING_SYSTEMCONSOLE: unchanged,
-        CONFIG_SETTING_CONFIGJSON: unchanged,
-        CONFIG_SETTING_ENVIRONMENT: unchanged,
-        CONFIG_SETTING_DESCRIPTION: unchanged,
-    }
+    # Read-only, since the option spec is shared by every directive instance
+    option_spec = MappingProxyType(
+        {
+            CONFIG_SETTING_DISPLAYNAME: unchanged,
+            CONFIG_SETTING_SYSTEMCONSOLE: unchanged,
+            CONFIG_SETTING_CONFIGJSON: unchanged,
+            CONFIG_SETTING_ENVIRONMENT: unchanged,
+            CONFIG_SETTING_DESCRIPTION: unchanged,
+        }
+    )
 
     def run(self) -> List[Node]:
         replacement_nodes: List[Node] = list()
         # Add an anchor node, so we can refer to this section later
         replacement_nodes.append(AnchorNode(self.arguments[0]))
         # If there is content, then collect it into a string and append it to the short description
-        long_description = ""
-        for content_line in self.content:
-            if content_line != "":
-                long_description += content_line.rstrip()
-            long_description += "\n"
+        long_description = "\n".join(
+            content_line.rstrip() for content_line in self.content
+        )
         short_description = ""
         if CONFIG_SETTING_DESCRIPTION in self.options:
             short_description = self.options[CONFIG_SETTING_DESCRIPTION]
@@ -139,6 +141,8 @@ class ConfigSettingDirective(SphinxDirective):
             CONFIG_SETTING_DESCRIPTION: description,
         }
         replacement_nodes.append(ConfigSettingNode(config_setting))
+        # Flag this document so doctree_read() knows it has config settings to collect
+        self.env.temp_data[TEMP_DATA_HAS_CONFIG_SETTINGS] = True
         # Get the domain and add a reference to this config setting, so we can process XRefs
         config_domain = self.env.domains["config"]
         if isinstance(config_domain, ConfigSettingDomain):
@@ -153,16 +157,26 @@ class ConfigSettingDomain(Domain):
 
     name = "config"
     label = "Mattermost configuration setting"
-    roles = {
-        "ref": XRefRole(),
-    }
-    directives = {
-        "setting": ConfigSettingDirective,
-    }
+    # Sphinx copies these into per-instance dicts when the domain is created, so the class-level
+    # mappings can be read-only
+    roles = MappingProxyType(
+        {
+            "ref": XRefRole(),
+        }
+    )
+    directives = MappingProxyType(
+        {
+            "setting": ConfigSettingDirective,
+        }
+    )
     initial_data = {
-        # List[Tuple[str, str, str, str, str, int]] ==> List[Tuple[name, dispname, type, docname, anchor, priority]]
-        "configs": list(),
+        # Dict[str, Tuple[str, str]] ==> Dict[dispname, Tuple[docname, anchor]]
+        # The name, type and priority of a setting are derived from these, so they are not stored
+        # in (and pickled with) the environment
+        "configs": dict(),
     }
+    # Bump this whenever the layout of `initial_data` changes so pickled environments are rebuilt
+    data_version = 2
 
     def get_full_qualified_name(self, node: Element) -> Optional[str]:
         if isinstance(node, ConfigSettingNode):
@@ -173,8 +187,18 @@ class ConfigSettingDomain(Domain):
         # yield from an empty list, so we do not add anything to the Sphinx search index
         yield from list()
 
+    def clear_doc(self, docname: str) -> None:
+        for dispname, config_setting in list(self.data["configs"].items()):
+            if config_setting[0] == docname:
+                del self.data["configs"][dispname]
+
     def merge_domaindata(self, docnames: List[str], otherdata: Dict) -> None:
-        self.data["configs"].extend(otherdata["configs"])
+        # Only take the settings of the documents the reader worker read; its other entries are stale copies
+        # of this environment's data
+        read_docnames = set(docnames)
+        for dispname, config_setting in otherdata["configs"].items():
+            if config_setting[0] in read_docnames:
+                self.data["configs"].setdefault(dispname, config_setting)
 
     def resolve_any_xref(
         self,
@@ -190,14 +214,9 @@ class ConfigSettingDomain(Domain):
     def resolve_xref(
         self, env, fromdocname, builder, typ, target, node, contnode
     ) -> Optional[Node]:
-        match = [
-            (docname, anchor)
-            for name, sig, typ, docname, anchor, prio in self.data["configs"]
-            if sig == target
-        ]
-        if len(match) > 0:
-            todocname = match[0][0]
-            targ = match[0][1]
+        match = self.data["configs"].get(target)
+        if match is not None:
+            todocname, targ = match
             return make_refnode(builder, fromdocname, todocname, targ, contnode, targ)
         else:
             logger.warning(
@@ -209,34 +228,28 @@ class ConfigSettingDomain(Domain):
 
     def add_config_setting(self, setting: dict[str, str]) -> None:
         """
-        Add a config setting to the list of config settings
+        Add a config setting to the config settings, keyed by its display name. If several settings share a display
+        name, the first one added is kept.
           :param setting: Setting metadata
           :return: None
         """
-        name = "config.setting_%s" % setting[CONFIG_SETTING_ID]
-        anchor = setting[CONFIG_SETTING_ID]
-        config_setting = (
-            name,
-            setting[CONFIG_SETTING_DISPLAYNAME],
-            "setting",
-            self.env.docname,
-            anchor,
-            0,
-        )
+        dispname = setting[CONFIG_SETTING_DISPLAYNAME]
+        config_setting = (self.env.docname, setting[CONFIG_SETTING_ID])
         logger.verbose(
             "ConfigSettingDomain: add_config_setting(): "
-            "appending config: name=%s, dispname=%s, type=%s, docname=%s, anchor=%s, priority=%d"
-            % config_setting
+            "appending config: dispname=%s, docname=%s, anchor=%s",
+            dispname,
+            *config_setting,
         )
-        self.data["configs"].append(config_setting)
+        self.data["configs"].setdefault(dispname, config_setting)
 
 
 def env_purge_doc(app: Sphinx, env: BuildEnvironment, docname: str) -> None:
     if hasattr(env, "config_settings"):
         if docname in env.config_settings:
             logger.verbose(
-                "config-setting-v2: env_purge_doc(): removing doc %s from config_settings"
-                % docname
+                "config-setting-v2: env_purge_doc(): removing doc %s from config_settings",
+                docname,
             )
             env.config_settings.pop(docname)
 
@@ -250,8 +263,9 @@ def env_merge_info(
         for docname in docnames:
             if docname in other.config_settings:
                 logger.verbose(
-                    "config-setting-v2: env_merge_info(): adding %d settings to config_settings[%s]"
-                    % (len(other.config_settings[docname]), docname)
+                    "config-setting-v2: env_merge_info(): adding %d settings to config_settings[%s]",
+                    len(other.config_settings[docname]),
+                    docname,
                 )
                 if len(other.config_settings[docname]) > 0:
                     env.config_settings[docname] = other.config_settings[docname]
@@ -260,37 +274,31 @@ def env_merge_info(
 def doctree_read(app: Sphinx, doctree: nodes.document):
     if not hasattr(app.env, "config_settings"):
         app.env.config_settings = dict()
+    # Skip walking the doctree if no config setting directive ran while reading this document
+    if not app.env.temp_data.get(TEMP_DATA_HAS_CONFIG_SETTINGS, False):
+        return
     # Check if this document has the :nosearch: metadata attribute; skip if it does
     if app.env.docname in app.env.metadata:
         if "nosearch" in app.env.metadata[app.env.docname]:
             logger.debug(
-                "config-setting-v2: doctree_read(): doc %s has :nosearch: attribute; skipping it"
-                % app.env.docname
+                "config-setting-v2: doctree_read(): doc %s has :nosearch: attribute; skipping it",
+                app.env.docname,
             )
             return
-    config_nodes = doctree.traverse(ConfigSettingNode, False, True, False, False)
-    if len(config_nodes) == 0:
+    # Collect the metadata of every ConfigSettingNode in the document
+    doc_config_settings: List[Dict[str, str]] = [
+        config_node.config_settings
+        for config_node in doctree.findall(ConfigSettingNode, include_self=False)
+    ]
+    if len(doc_config_settings) == 0:
         return
-    logger.verbose(
-        "config-setting-v2: doctree_read(): found %d ConfigSettingNodes in doc %s"
-        % (len(config_nodes), app.env.docname)
+    logger.info(
+        "config-setting-v2: %d config settings in %s"
+        % (len(doc_config_settings), app.env.docname)
+    )
+    app.env.config_settings.setdefault(app.env.docname, list()).extend(
+        doc_config_settings
     )
-    doc_config_settings: List[Dict[str, str]] = list()
-    for config_node in config_nodes:
-        doc_config_settings.append(config_node.config_settings)
-    if len(doc_config_settings) > 0:
-        logger.info(
-            "config-setting-v2: %d config settings in %s"
-            % (len(doc_config_settings), app.env.docname)
-        )
-        if app.env.docname not in app.env.config_settings:
-            app.env.config_settings[app.env.docname] = list()
-        app.env.config_settings[app.env.docname].extend(doc_config_settings)
-    else:
-        logger.verbose(
-            "config-setting-v2: doctree_read(): no config settings in doc %s"
-            % app.env.docname
-        )
 
 
 def build_finished(app: Sphinx, exception: Exception):
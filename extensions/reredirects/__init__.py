@@ -93,8 +93,8 @@ def env_updated(app: Sphinx, env: BuildEnvironment) -> list[str]:
             if page in env.all_docs:
                 intra_page_fragments.append(page)
         logger.verbose(
-            "env_updated(): found %d intra-page fragment pages"
-            % len(intra_page_fragments)
+            "env_updated(): found %d intra-page fragment pages",
+            len(intra_page_fragments),
         )
         setattr(app.env, ENV_INTRA_PAGE_FRAGMENT_PAGES, intra_page_fragments)
     return list()
@@ -108,7 +108,7 @@ def html_page_context(
     doctree: dict,
 ) -> str:
     logger.verbose(
-        f"html_page_context(): pagename={pagename}, templatename={templatename}"
+        "html_page_context(): pagename=%s, templatename=%s", pagename, templatename
     )
     is_enabled: bool = getattr(app.env, ENV_REDIRECTS_ENABLED)
     if is_enabled:
@@ -122,7 +122,8 @@ def html_page_context(
             and pagename in intra_page_fragments
         ):
             logger.verbose(
-                f"html_page_context(): page {pagename} has intra-page redirects; adding redirects to HTML context"
+                "html_page_context(): page %s has intra-page redirects; adding redirects to HTML context",
+                pagename,
             )
             computed_redirects: dict[str, dict[str, str]] = getattr(
                 app.env, ENV_COMPUTED_REDIRECTS
@@ -169,25 +170,29 @@ def html_collect_pages(app: Sphinx) -> list[tuple[str, dict[str, Any], str]]:
     computed_redirects: dict[str, dict[str, str]] = getattr(
         app.env, ENV_COMPUTED_REDIRECTS
     )
-    for page in computed_redirects.keys():
+    all_docs = app.env.all_docs
+    for page, page_redirects in computed_redirects.items():
         # if page is a real page in the doctree, we've already handled it elsewhere
-        if page in app.env.all_docs:
+        if page in all_docs:
             logger.verbose(
-                f"html_collect_pages(): page {page} has intra-page redirects; skipping it"
+                "html_collect_pages(): page %s has intra-page redirects; skipping it",
+                page,
             )
             continue
         # Handle the case where there is a single redirect defined for a source page
-        if len(computed_redirects[page]) == 1:
+        if len(page_redirects) == 1:
             # if this page only has a redirect to the DEFAULT_PAGE, then use a simple redirect template
-            if DEFAULT_PAGE in computed_redirects[page]:
+            if DEFAULT_PAGE in page_redirects:
                 logger.verbose(
-                    f"html_collect_pages(): simple redirect from {page} to {computed_redirects[page][DEFAULT_PAGE]}"
+                    "html_collect_pages(): simple redirect from %s to %s",
+                    page,
+                    page_redirects[DEFAULT_PAGE],
                 )
                 redirect_pages.append(
                     (
                         page,
                         {
-                            "to_uri": computed_redirects[page][DEFAULT_PAGE],
+                            "to_uri": page_redirects[DEFAULT_PAGE],
                             "toctree": toctree_returns_none,  # short-cut for the `furo` theme
                         },
                         "simpleredirect.html",  # TODO: move this into a config variable
@@ -198,18 +203,15 @@ def html_collect_pages(app: Sphinx) -> list[tuple[str, dict[str, Any], str]]:
                 continue
             # there's only one fragment redirect, and it's not DEFAULT_PAGE. if someone browses to the page, they
             # will see a blank screen. we add a DEFAULT_PAGE redirect in that case.
-            default_page_url = ""
-            for frag in computed_redirects[page].keys():
-                default_page_url = computed_redirects[page][frag]
-                break
+            default_page_url = next(iter(page_redirects.values()), "")
             if default_page_url != "":
-                computed_redirects[page][DEFAULT_PAGE] = default_page_url
+                page_redirects[DEFAULT_PAGE] = default_page_url
                 logger.debug(
-                    f"html_collect_pages(): added DEFAULT_PAGE redirect for {page}"
+                    "html_collect_pages(): added DEFAULT_PAGE redirect for %s", page
                 )
         # build a JS object that will hold the fragment redirect map
-        jsobject = build_js_object(computed_redirects[page])
-        logger.verbose(f"html_collect_pages(): redirect from {page}; {jsobject}")
+        jsobject = build_js_object(page_redirects)
+        logger.verbose("html_collect_pages(): redirect from %s; %s", page, jsobject)
         redirect_pages.append(
             (
                 page,
@@ -251,8 +253,9 @@ def build_finished(app: Sphinx, exception: Exception):
                     continue
                 source_file = str(target_file) + ".html"
                 logger.verbose(
-                    "build_finished(): extensionless redirect; %s -> %s"
-                    % (source_file, target_file)
+                    "build_finished(): extensionless redirect; %s -> %s",
+                    source_file,
+                    target_file,
                 )
                 copyfile(source_file, target_file)
 
@@ -272,30 +275,22 @@ def compute_redirects(
         redirects_baseurl = ""
     # process each record in the redirects dict
     for source in redirects_option.keys():
-        # split the URL on # so we get the path and page name + the fragment, if any
-        tokens = source.split("#")
-        if len(tokens) == 2:
-            pagename = tokens[0].removesuffix(
-                ".html"
-            )  # ensure pagename does not end with ".html"
-            fragment = tokens[1].removesuffix(
-                ".html"
-            )  # if the fragment ends in ".html", remove it
-        elif len(tokens) == 1:
-            pagename = tokens[0].removesuffix(
-                ".html"
-            )  # ensure pagename does not end with ".html"
-            fragment = ""
-        else:
+        # partition the URL on # so we get the path and page name + the fragment, if any
+        pagename, _, fragment = source.partition("#")
+        # a second # means the redirect is invalid
+        if "#" in fragment:
             logger.warning("compute_redirects(): invalid redirect: %s" % source)
             continue
+        # ensure pagename does not end with ".html"
+        pagename = pagename.removesuffix(".html")
+        # if the fragment ends in ".html", remove it
+        fragment = fragment.removesuffix(".html")
         # if the source page is the empty string then the redirect is invalid. warn the user and continue on.
         if pagename == "":
             logger.warning("compute_redirects(): empty page name: %s" % source)
             continue
         # add a new dict to redirect_map if the page has not been seen before
-        if pagename not in computed_redirects:
-            computed_redirects[pagename] = dict()
+        page_redirects = computed_redirects.setdefault(pagename, dict())
         # Get the target link of the redirect
         target = redirects_option[source]
         # If the target is the empty string then the redirect is invalid. warn the user and continue on.
@@ -309,10 +304,10 @@ def compute_redirects(
         # if there's no fragment then we're redirecting to the "default page", which is
         # the `pagename` without any fragment.
         if fragment == "":
-            computed_redirects[pagename][DEFAULT_PAGE] = target
+            page_redirects[DEFAULT_PAGE] = target
             continue
         # redirect the fragment to the desired page
-        computed_redirects[pagename][fragment] = target
+        page_redirects[fragment] = target
     # remove empty keys from the map
     empty_keys: list[str] = list()
     for key in computed_redirects.keys():
@@ -324,10 +319,8 @@ def compute_redirects(
 
 
 def build_js_object(pagemap: dict[str, str]) -> str:
-    jsobject = f"const {CTX_FRAGMENT_REDIRECTS} = Object.freeze(" + "{"
-    for frag in pagemap.keys():
-        jsobject += f'"{frag}":"{pagemap[frag]}",'
-    return jsobject.rstrip(",") + "});"
+    entries = ",".join(f'"{frag}":"{target}"' for frag, target in pagemap.items())
+    return f"const {CTX_FRAGMENT_REDIRECTS} = Object.freeze({{{entries}}});"
 
 
 def old_status_iterator(
@@ -85,12 +85,12 @@ def env_purge_doc(app: Sphinx, env: BuildEnvironment, docname: str):
     :param env: The Sphinx BuildEnvironment
     :param docname: The name of the document to purge
     """
-    logger.debug("env_purge_doc: docname=%s" % docname)
+    logger.debug("env_purge_doc: docname=%s", docname)
     if hasattr(env, "sitemap_links"):
         sitemap_links: dict[str, str] = env.sitemap_links
         if sitemap_links.get(docname) is not None:
             logger.debug(
-                "env_purge_doc: sitemap_links contains %s; removing it" % docname
+                "env_purge_doc: sitemap_links contains %s; removing it", docname
             )
             env.sitemap_links.pop(docname)
 
@@ -122,7 +122,7 @@ def env_merge_info(
     # Calculate the document link for each docname and add it to the `sitemap_links` attribute in the environment
     for docname in docnames:
         link = calculate_link(is_dictionary_builder, docname)
-        logger.debug("env_merge_info: docname=%s, link=%s" % (docname, link))
+        logger.debug("env_merge_info: docname=%s, link=%s", docname, link)
         env.sitemap_links[docname] = link
 
 
@@ -264,24 +264,26 @@ def create_sitemap(app: Sphinx) -> list[tuple[str, dict[str, Any], str]]:
         lang = app.builder.config.language + "/"
     else:
         lang = ""
+    # The URL prefix and `hreflang` value of each alternate locale
+    alternates: list[tuple[str, str]] = [
+        (locale + "/", hreflang_formatter(locale.rstrip("/"))) for locale in locales
+    ]
     # Add each document link as a child of the root XML element
-    for linkKey in sitemap_links.keys():
-        # Retrieve the linked document filename including extension
-        link = sitemap_links[linkKey]
+    for link in sitemap_links.values():
         # Create a new XML child element of the root element for this link
         url = ElementTree.SubElement(root, "url")
         ElementTree.SubElement(url, "loc").text = site_url + scheme.format(
             lang=lang, version=version, link=link
         )
         # Add a sub-element for each locale
-        for lang in locales:
-            lang = lang + "/"
+        for locale_prefix, hreflang in alternates:
             ElementTree.SubElement(
                 url,
                 "{http://www.w3.org/1999/xhtml}link",
                 rel="alternate",
-                hreflang=hreflang_formatter(lang.rstrip("/")),
-                href=site_url + scheme.format(lang=lang, version=version, link=link),
+                hreflang=hreflang,
+                href=site_url
+                + scheme.format(lang=locale_prefix, version=version, link=link),
             )
     # Determine the output filename of the sitemap and write the XML document to it
     filename = Path(app.outdir).joinpath(app.config.sitemap_filename)
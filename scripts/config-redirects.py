@@ -83,14 +83,13 @@ def get_title_and_table(node: nodes.section) -> Tuple[str, str]:
 
 
 def pick_config_settings(node: nodes.Node, config_settings: Dict[str, Tuple[str, str]]):
-    if isinstance(node, nodes.section):
-        if has_title_and_table(node):
-            sec_title, sec_table = get_title_and_table(node)
+    # visit every section in the document, in document order
+    for section in node.findall(nodes.section):
+        if has_title_and_table(section):
+            sec_title, sec_table = get_title_and_table(section)
             title_frag = make_id(sec_title)
             # store title and table info in config_settings dict with fragment as key
             config_settings[title_frag] = (sec_title, sec_table)
-    for child in node.children:
-        pick_config_settings(child, config_settings)
 
 
 def main():
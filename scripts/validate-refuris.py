@@ -12,7 +12,7 @@ usage example: pipenv run python scripts/validate-refuris.py
 
 import pickle
 from glob import iglob
-from typing import List, cast
+from typing import List, Optional, cast
 from docutils import nodes
 from sphinx import addnodes
 from os import path
@@ -22,8 +22,8 @@ BASE_DIR = "build/doctrees"
 
 
 def validate_refuri(node: nodes.reference, invalid_refs: List[str]):
-    if "refuri" in node.attributes:
-        refuri: str = node["refuri"]
+    refuri: Optional[str] = node.get("refuri")
+    if refuri is not None:
         # remove docs.mattermost.com prefix since that's the base URL
         if refuri.startswith("https://docs.mattermost.com"):
             refuri = refuri.removeprefix("https://docs.mattermost.com")
@@ -46,12 +46,9 @@ def validate_refuri(node: nodes.reference, invalid_refs: List[str]):
 
 
 def walk_node(node: nodes.Node, invalid_refs: List[str]):
-    # If this is a reference node, it will have a ``refuri`` that we want to validate
-    if isinstance(node, nodes.reference):
-        validate_refuri(cast(nodes.reference, node), invalid_refs)
-    # Walk the node's children
-    for child in node.children:
-        walk_node(child, invalid_refs)
+    # Only reference nodes have a ``refuri`` that we want to validate, so iterate just those
+    for reference in node.findall(nodes.reference):
+        validate_refuri(cast(nodes.reference, reference), invalid_refs)
 
 
 def main():
@@ -0,0 +1,47 @@
+"""
+Config setting tests
+"""
+import pytest
+
+from pathlib import Path
+
+
+@pytest.mark.sphinx('html', testroot='config-setting')
+class TestResolveXref:
+    def test_nominal(self, app):
+        app.build()
+        index_html = Path(app.outdir, "index.html").read_text()
+        assert 'href="beta.html#beta-setting"' in index_html
+
+    def test_first_setting_wins(self, app):
+        app.build()
+        index_html = Path(app.outdir, "index.html").read_text()
+        assert 'href="alpha.html#alpha-first"' in index_html
+        assert 'href="alpha.html#alpha-second"' not in index_html
+
+
+@pytest.mark.sphinx('html', testroot='config-setting')
+class TestClearDoc:
+    def test_nominal(self, app):
+        app.build()
+        config_domain = app.env.get_domain("config")
+        config_domain.clear_doc("alpha")
+        assert config_domain.data["configs"] == {"Beta setting": ("beta", "beta-setting")}
+
+
+@pytest.mark.sphinx('html', testroot='config-setting')
+class TestMergeDomainData:
+    def test_only_read_docs(self, app):
+        app.build()
+        config_domain = app.env.get_domain("config")
+        config_domain.clear_doc("beta")
+        other_configs = {
+            # stale copy of a document the worker did not read
+            "Shared setting": ("alpha", "alpha-stale"),
+            "Beta setting": ("beta", "beta-renamed"),
+        }
+        config_domain.merge_domaindata(["beta"], {"configs": other_configs})
+        assert config_domain.data["configs"] == {
+            "Shared setting": ("alpha", "alpha-first"),
+            "Beta setting": ("beta", "beta-renamed"),
+        }
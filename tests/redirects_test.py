@@ -245,3 +245,8 @@ class TestBuildJSObject:
              + ' = Object.freeze({"-":"foo.html","frag1":"foo2.html#frag2","frag3":"#frag4"});')
         actual_js_object = ext_build_js_object(pagemap)
         assert(actual_js_object == expected_js_object)
+
+    def test_empty(self, app):
+        expected_js_object = 'const ' + CTX_FRAGMENT_REDIRECTS + ' = Object.freeze({});'
+        actual_js_object = ext_build_js_object(dict())
+        assert(actual_js_object == expected_js_object)
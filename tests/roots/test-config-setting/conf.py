@@ -0,0 +1 @@
+extensions = ["extensions.config-setting-v2"]
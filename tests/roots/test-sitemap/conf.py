@@ -0,0 +1,4 @@
+extensions = ["extensions.sitemap"]
+html_baseurl = "https://docs.example.com/"
+language = "en"
+sitemap_locales = ["en", "de", "pt_BR"]
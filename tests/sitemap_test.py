@@ -0,0 +1,37 @@
+"""
+Sitemap tests
+"""
+import pytest
+
+from extensions.sitemap import create_sitemap as ext_create_sitemap
+from pathlib import Path
+from xml.etree import ElementTree
+
+SITEMAP_NS = {
+    "sm": "http://www.sitemaps.org/schemas/sitemap/0.9",
+    "xhtml": "http://www.w3.org/1999/xhtml",
+}
+
+
+@pytest.mark.sphinx('html', testroot='sitemap')
+class TestCreateSitemap:
+    def test_nominal(self, app):
+        app.env.sitemap_links = {"index": "index.html", "foo": "foo.html", "bar/baz": "bar/baz.html"}
+        result = ext_create_sitemap(app)
+        assert result == list()
+        root = ElementTree.parse(Path(app.outdir, "sitemap.xml")).getroot()
+        urls = root.findall("sm:url", SITEMAP_NS)
+        assert len(urls) == 3
+        for url, link in zip(urls, app.env.sitemap_links.values()):
+            # every <loc> uses the primary language, not one of the alternate locales
+            assert url.find("sm:loc", SITEMAP_NS).text == "https://docs.example.com/en/" + link
+            alternates = url.findall("xhtml:link", SITEMAP_NS)
+            assert [(alternate.get("hreflang"), alternate.get("href")) for alternate in alternates] == [
+                ("de", "https://docs.example.com/de/" + link),
+                ("pt-BR", "https://docs.example.com/pt_BR/" + link),
+            ]
+
+    def test_no_links(self, app, warning):
+        result = ext_create_sitemap(app)
+        assert result == list()
+        assert "No pages generated for sitemap.xml" in warning.getvalue()